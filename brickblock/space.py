@@ -1,5 +1,6 @@
 # TODO: Get isort working so we can sort these imports
 from dataclasses import dataclass
+import numbers
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -11,6 +12,54 @@ from brickblock.objects import Cube, Cuboid, CompositeCube
 from brickblock.visualisation import VisualisationBackend
 
 
+# The types used to store each visual property. Numeric properties are stored
+# densely, while colours (which may be names, tuples, or None) are stored as
+# Python objects.
+_VISUAL_METADATA_DTYPES = {
+    "facecolor": object,
+    "linewidth": np.float64,
+    "edgecolor": object,
+    "alpha": np.float64,
+}
+
+
+def _as_single_value(value: Any) -> np.ndarray:
+    """
+    Wrap `value` in a 0-d array, so that it is treated as a single value when
+    assigning it to multiple entries of a visual metadata array.
+
+    Without this, sequences such as RGB tuples would be assigned elementwise.
+
+    # Args
+        value: The value of a visual property.
+    """
+    wrapped_value = np.empty((), dtype=object)
+    wrapped_value[()] = value
+    return wrapped_value
+
+
+def _check_visual_property(key: str, value: Any) -> Any:
+    """
+    Check that `value` can be stored for the visual property `key`, and return
+    it.
+
+    Numeric properties are stored as floats, so values that are not real
+    numbers (including None) are rejected rather than stored as NaN.
+
+    # Args
+        key: The name of the visual property.
+        value: The value of the visual property.
+    """
+    if key not in _VISUAL_METADATA_DTYPES:
+        raise KeyError(
+            "The provided key doesn't match any valid visual property."
+        )
+    is_numeric = _VISUAL_METADATA_DTYPES[key] is not object
+    if is_numeric and not isinstance(value, numbers.Real):
+        raise ValueError(f"The visual property {key} must be a real number.")
+    return value
+
+
 # TODO: Decide if we want to use classes for this, what details need adding to
 # make these transforms useful, etc.
 # TODO: Add docstrings
@@ -94,8 +143,8 @@ class Space:
     matplotlib.
 
     # Attributes
-        mean: The mean point of the space. This is stored for potential use with
-            the camera when rendering a scene.
+        mean: The mean point of the space, computed from the total. This is
+            for potential use with the camera when rendering a scene.
         total: The total value per dimension of all objects. This is stored for
             potential use with the camera when rendering a scene.
         num_objs: The total number of objects in the space. Distinct primitives
@@ -103,7 +152,9 @@ class Space:
         time_step: The number of individual transforms done to the space.
         scene_counter: The number of scenes to render.
         cuboid_visual_metadata: The visual properties for each primitive in the
-            space. Objects are stored in order of insertion.
+            space, with one array per property. Objects are stored in order of
+            insertion, and the arrays share the capacity of the coordinate
+            data.
         cuboid_index: A hierarchial index of the objects inserted into the
             space.
         cuboid_names: A mapping between names and objects/primitives.
@@ -111,7 +162,6 @@ class Space:
     """
 
     # TODO: Clarify dimensions for things being WHD or XYZ (or a mix).
-    mean: np.ndarray
     total: np.ndarray
     num_objs: int
     time_step: int
@@ -120,7 +170,7 @@ class Space:
     # TODO: Should these be classes?
     base_coordinates: np.ndarray
     cuboid_shapes: np.ndarray
-    cuboid_visual_metadata: dict[str, list]
+    cuboid_visual_metadata: dict[str, np.ndarray]
     cuboid_index: TemporalIndex
     cuboid_names: dict[str, tuple[list[int], list[slice]]]
     # TODO: Document the changelog structure.
@@ -130,7 +180,6 @@ class Space:
     visualisation_backend: VisualisationBackend
 
     def __init__(self) -> None:
-        self.mean = np.zeros((3, 1))
         self.total = np.zeros((3, 1))
         self.num_objs = 0
         self.object_counter = 0
@@ -139,7 +188,10 @@ class Space:
         self.scene_counter = 0
         self.base_coordinates = np.zeros((10, 3))
         self.cuboid_shapes = np.zeros((10, 3))
-        self.cuboid_visual_metadata = {}
+        self.cuboid_visual_metadata = {
+            key: np.zeros(self.base_coordinates.shape[0], dtype=dtype)
+            for key, dtype in _VISUAL_METADATA_DTYPES.items()
+        }
         self.cuboid_index = TemporalIndex()
         self.composite_index = TemporalIndex()
         self.cuboid_names = {}
@@ -156,6 +208,15 @@ class Space:
         self.basis[self.dimensions["depth"], 2] = 1
         self.visualisation_backend = VisualisationBackend(self.basis)
 
+    @property
+    def mean(self) -> np.ndarray:
+        """
+        The mean point of the space, computed from the total when requested.
+
+        An empty space has a mean at the origin.
+        """
+        return self.total / max(self.object_counter, 1)
+
     def add_cube(self, cube: Cube) -> None:
         """
         Add a Cube primitive to the space.
@@ -225,41 +286,28 @@ class Space:
             cuboid: Primitive Cube/Cuboid to add to the space's various data
             structures.
         """
-        base = cuboid.base.reshape((3, 1))
-        shape = np.array(cuboid.shape()).reshape((3, 1))
-        cuboid_mean = (base + (base + shape)) / 2
+        visual_metadata = {
+            key: _check_visual_property(key, value)
+            for key, value in cuboid.visual_metadata().items()
+        }
+        shape = np.array(cuboid.shape())
+        # The mean of the cuboid is halfway between its base and far corner.
+        cuboid_mean = cuboid.base + 0.5 * shape
 
-        # Update the bounding box - via total and mean.
-        self.total += cuboid_mean
-
-        self.mean = self.total / (self.object_counter + 1)
+        # Update the bounding box - via the total.
+        self.total += cuboid_mean.reshape((3, 1))
 
         # Update the coordinate data, resizing if necessary.
-        current_no_of_entries = self.base_coordinates.shape[0]
-        if self.object_counter >= current_no_of_entries:
-            # refcheck set to False since this avoids issues with the debugger
-            # referencing the array!
-            self.base_coordinates.resize(
-                (2 * current_no_of_entries, self.base_coordinates.shape[1]),
-                refcheck=False,
-            )
-            # Repeat this for the shape array as well.
-            self.cuboid_shapes.resize(
-                (2 * current_no_of_entries, self.cuboid_shapes.shape[1]),
-                refcheck=False,
-            )
+        self._ensure_capacity(self.object_counter + 1)
 
         # Add shape data for this cuboid.
-        self.cuboid_shapes[self.object_counter] = cuboid.shape()
+        self.cuboid_shapes[self.object_counter] = shape
 
         self.base_coordinates[self.object_counter] = cuboid.base
 
         # Update the visual metadata store.
-        for key, value in cuboid.visual_metadata().items():
-            if key in self.cuboid_visual_metadata.keys():
-                self.cuboid_visual_metadata[key].append(value)
-            else:
-                self.cuboid_visual_metadata[key] = [value]
+        for key, value in visual_metadata.items():
+            self.cuboid_visual_metadata[key][self.object_counter] = value
 
         self.cuboid_index.add_item_to_index(
             self.object_counter, self.time_step, self.scene_counter
@@ -272,42 +320,29 @@ class Space:
         return primitive_id
 
     def _add_cuboid_composite(self, composite: CompositeCube) -> int:
-        # Update bounding box
-        base = composite.base.reshape((3, 1))
-        shape = np.array(composite.shape()).reshape((3, 1))
-        composite_mean = (base + (base + shape)) / 2
-
-        self.total += composite_mean
-
-        # We only add one to the denominator because we added a single object.
-        self.mean = self.total / (self.object_counter + 1)
+        visual_metadata = {
+            key: _check_visual_property(key, value)
+            for key, value in composite.visual_metadata().items()
+        }
+        # Update bounding box. The composite is axis-aligned, so its mean is
+        # halfway between its base and far corner - there is no need to reduce
+        # over the points of each of its cubes.
+        shape = np.array(composite.shape())
+        composite_mean = composite.base + 0.5 * shape
+
+        self.total += composite_mean.reshape((3, 1))
 
         # Update coordinate array
-        current_no_of_entries = self.base_coordinates.shape[0]
-        if self.object_counter >= current_no_of_entries:
-            # refcheck set to False since this avoids issues with the debugger
-            # referencing the array!
-            self.base_coordinates.resize(
-                (2 * current_no_of_entries, self.base_coordinates.shape[1]),
-                refcheck=False,
-            )
-            # Repeat this for the shape array as well.
-            self.cuboid_shapes.resize(
-                (2 * current_no_of_entries, self.cuboid_shapes.shape[1]),
-                refcheck=False,
-            )
+        self._ensure_capacity(self.object_counter + 1)
 
         # Add shape data for this composite.
-        self.cuboid_shapes[self.object_counter] = composite.shape()
+        self.cuboid_shapes[self.object_counter] = shape
 
         self.base_coordinates[self.object_counter] = composite.base
 
         # Update visual metadata store
-        for key, value in composite.visual_metadata().items():
-            if key in self.cuboid_visual_metadata.keys():
-                self.cuboid_visual_metadata[key].append(value)
-            else:
-                self.cuboid_visual_metadata[key] = [value]
+        for key, value in visual_metadata.items():
+            self.cuboid_visual_metadata[key][self.object_counter] = value
 
         # Add to index
         self.composite_index.add_item_to_index(
@@ -324,6 +359,43 @@ class Space:
 
         return composite_id
 
+    def _ensure_capacity(self, num_entries: int) -> None:
+        """
+        Grow the coordinate, shape, and visual metadata buffers so they can hold
+        at least `num_entries` objects.
+
+        The capacity is at least doubled and the buffers are resized once, so
+        that inserts are amortised O(1).
+
+        # Args
+            num_entries: The number of objects the buffers need to hold.
+        """
+        current_no_of_entries = self.base_coordinates.shape[0]
+        if num_entries <= current_no_of_entries:
+            return
+
+        new_no_of_entries = max(2 * current_no_of_entries, num_entries)
+
+        # refcheck set to False since this avoids issues with the debugger
+        # referencing the array!
+        self.base_coordinates.resize(
+            (new_no_of_entries, self.base_coordinates.shape[1]),
+            refcheck=False,
+        )
+        # Repeat this for the shape array as well.
+        self.cuboid_shapes.resize(
+            (new_no_of_entries, self.cuboid_shapes.shape[1]),
+            refcheck=False,
+        )
+        # The visual properties are copied into new arrays rather than resized
+        # in place - the colour columns hold Python objects, so resizing them
+        # without a reference check would leave any existing views pointing at
+        # freed objects.
+        for key, column in self.cuboid_visual_metadata.items():
+            new_column = np.zeros(new_no_of_entries, dtype=column.dtype)
+            new_column[:current_no_of_entries] = column
+            self.cuboid_visual_metadata[key] = new_column
+
     def _add_name(
         self,
         name: str | None,
@@ -547,19 +619,20 @@ class Space:
             kwargs: Sequence of named arguments that contain updated visual
                 property values.
         """
-        before_mutation_kwargs = {}
-        for key in kwargs.keys():
-            if key not in self.cuboid_visual_metadata.keys():
-                raise KeyError(
-                    "The provided key doesn't match any valid visual property."
-                )
-            before_mutation_kwargs[key] = []
-            joined_ids = sorted(primitive_ids + composite_ids)
+        # Check every value before writing any of them, so that an invalid
+        # value cannot leave the space partially mutated.
+        new_values = {
+            key: _as_single_value(_check_visual_property(key, value))
+            for key, value in kwargs.items()
+        }
 
-            for id in joined_ids:
-                old_val = self.cuboid_visual_metadata[key][id]
-                before_mutation_kwargs[key].append(old_val)
-                self.cuboid_visual_metadata[key][id] = kwargs[key]
+        before_mutation_kwargs = {}
+        joined_ids = np.sort(np.array(primitive_ids + composite_ids, dtype=int))
+        for key, value in new_values.items():
+            # Read and write every selected entry at once.
+            column = self.cuboid_visual_metadata[key]
+            before_mutation_kwargs[key] = column[joined_ids].tolist()
+            column[joined_ids] = value
 
         for primitive_id in primitive_ids:
             self.cuboid_index.add_item_to_index(
@@ -825,11 +898,8 @@ class Space:
 
         joined_ids = primitive_ids + composite_ids
 
-        bases = self.base_coordinates[joined_ids]
-        shapes = self.cuboid_shapes[joined_ids]
-        object_means = (bases + (bases + shapes)) / 2
         # Subtract from the total.
-        self.total -= np.sum(object_means, axis=0).reshape((3, 1))
+        self.total -= self._sum_object_means(joined_ids)
 
         if coord_func is not None:
             self.base_coordinates[joined_ids] = coord_func(
@@ -840,11 +910,8 @@ class Space:
                 self.cuboid_shapes[joined_ids]
             )
 
-        bases = self.base_coordinates[joined_ids]
-        shapes = self.cuboid_shapes[joined_ids]
-        object_means = (bases + (bases + shapes)) / 2
         # Add to the total.
-        self.total += np.sum(object_means, axis=0).reshape((3, 1))
+        self.total += self._sum_object_means(joined_ids)
 
         for primitive_id in primitive_ids:
             self.cuboid_index.add_item_to_index(
@@ -861,6 +928,23 @@ class Space:
 
         return kwargs
 
+    def _sum_object_means(self, ids: list[int]) -> np.ndarray:
+        """
+        Return the sum of the mean points of the objects given by `ids`, as a
+        3x1 vector.
+
+        The mean of an object is `base + shape / 2`. The selected bases are
+        gathered into one copy, half of each shape is added to it in-place, and
+        the result is summed once.
+
+        # Args
+            ids: The IDs of the objects (primitive or composite) to sum over.
+        """
+        # Fancy indexing produces a copy, so it is safe to update in-place.
+        object_means = self.base_coordinates[ids]
+        object_means += 0.5 * self.cuboid_shapes[ids]
+        return object_means.sum(axis=0).reshape((3, 1))
+
     # TODO: Consider whether to support `create_by_offset`, which implies
     # creating an object with certain attributes, but its position is dictated
     # by other objects. How would this work?
@@ -930,29 +1014,24 @@ class Space:
         if len(primitive_ids) == 0 and len(composite_ids) == 0:
             return None
 
-        # Interleave the kwargs with the IDs to support the iterable case.
+        # Interleave the kwargs with the IDs to support the iterable case. Every
+        # value is checked here, before any object is added, so that an invalid
+        # value cannot leave the space with only some of the clones.
         total_number_of_ids = len(primitive_ids) + len(composite_ids)
         interleaved_kwargs = []
         for i in range(total_number_of_ids):
             kwargs_for_id = {}
             for key in kwargs.keys():
-                if key not in self.cuboid_visual_metadata.keys():
-                    raise KeyError(
-                        "The provided key doesn't match any valid visual "
-                        "property."
-                    )
                 if isinstance(kwargs[key], list):
-                    kwargs_for_id[key] = kwargs[key][i]
+                    value = kwargs[key][i]
                 else:
-                    kwargs_for_id[key] = kwargs[key]
+                    value = kwargs[key]
+                kwargs_for_id[key] = _check_visual_property(key, value)
             interleaved_kwargs.append(kwargs_for_id)
 
         new_primitive_ids = []
         for primitive, vis_met_data in zip(primitive_ids, interleaved_kwargs):
-            visual_metadata = {
-                key: self.cuboid_visual_metadata[key][primitive]
-                for key in self.cuboid_visual_metadata.keys()
-            }
+            visual_metadata = self._get_visual_properties(primitive)
             # Take the visual metadata, with the user-provided ones taking
             # precedence.
             visual_metadata = visual_metadata | vis_met_data
@@ -969,10 +1048,7 @@ class Space:
 
         new_composite_ids = []
         for composite, vis_met_data in zip(composite_ids, interleaved_kwargs):
-            visual_metadata = {
-                key: self.cuboid_visual_metadata[key][composite]
-                for key in self.cuboid_visual_metadata.keys()
-            }
+            visual_metadata = self._get_visual_properties(composite)
             # Take the visual metadata, with the user-provided ones taking
             # precedence.
             visual_metadata = visual_metadata | vis_met_data
@@ -1024,30 +1100,23 @@ class Space:
             for name in names:
                 del self.cuboid_names[name]
 
-            bases = self.base_coordinates[ids]
-            shapes = self.cuboid_shapes[ids]
-            # Compute means for objects
-            object_means = (bases + (bases + shapes)) / 2
             # Subtract from the total.
-            self.total -= np.sum(object_means, axis=0).reshape((3, 1))
+            self.total -= self._sum_object_means(ids)
 
             self.object_counter -= operation.inserted_count
-            self.mean = self.total / self.object_counter
         elif isinstance(operation, Mutation):
             joined_ids = sorted(ids)
 
+            # The previous values are stored in the same order as the sorted
+            # IDs.
             prior_state = operation.subject
-            for key in prior_state.keys():
-                before_val = prior_state[key]
-                for id in joined_ids:
-                    self.cuboid_visual_metadata[key][id] = before_val[id]
+            for key, before_vals in prior_state.items():
+                column = self.cuboid_visual_metadata[key]
+                for id, before_val in zip(joined_ids, before_vals):
+                    column[id] = before_val
         elif isinstance(operation, Transform):
-            bases = self.base_coordinates[ids]
-            shapes = self.cuboid_shapes[ids]
-            # Compute means for objects
-            object_means = (bases + (bases + shapes)) / 2
             # Subtract from the total.
-            self.total -= np.sum(object_means, axis=0).reshape((3, 1))
+            self.total -= self._sum_object_means(ids)
 
             # TODO: Decide whether the inverse transform in Transform objects
             # should be a function (allows consolidating checks, avoids annoying
@@ -1067,14 +1136,9 @@ class Space:
                     f"Unrecognised transform with name {transform_name}"
                 )
 
-            bases = self.base_coordinates[ids]
-            shapes = self.cuboid_shapes[ids]
-            # Compute means for objects
-            object_means = (bases + (bases + shapes)) / 2
             # Add to the total.
-            self.total += np.sum(object_means, axis=0).reshape((3, 1))
+            self.total += self._sum_object_means(ids)
 
-            self.mean = self.total / self.object_counter
         else:
             raise ValueError("Unsupported operation")
 
@@ -1100,30 +1164,23 @@ class Space:
                 for name in names:
                     del self.cuboid_names[name]
 
-                bases = self.base_coordinates[ids]
-                shapes = self.cuboid_shapes[ids]
-                # Compute means for objects
-                object_means = (bases + (bases + shapes)) / 2
                 # Subtract from the total.
-                self.total -= np.sum(object_means, axis=0).reshape((3, 1))
+                self.total -= self._sum_object_means(ids)
 
                 self.object_counter -= operation.inserted_count
-                self.mean = self.total / self.object_counter
             elif isinstance(operation, Mutation):
                 joined_ids = sorted(ids)
 
+                # The previous values are stored in the same order as the
+                # sorted IDs.
                 prior_state = operation.subject
-                for key in prior_state.keys():
-                    before_val = prior_state[key]
-                    for id in joined_ids:
-                        self.cuboid_visual_metadata[key][id] = before_val[id]
+                for key, before_vals in prior_state.items():
+                    column = self.cuboid_visual_metadata[key]
+                    for id, before_val in zip(joined_ids, before_vals):
+                        column[id] = before_val
             elif isinstance(operation, Transform):
-                bases = self.base_coordinates[ids]
-                shapes = self.cuboid_shapes[ids]
-                # Compute means for objects
-                object_means = (bases + (bases + shapes)) / 2
                 # Subtract from the total.
-                self.total -= np.sum(object_means, axis=0).reshape((3, 1))
+                self.total -= self._sum_object_means(ids)
 
                 # TODO: Decide whether the inverse transform in Transform
                 # objects should be a function (allows consolidating checks,
@@ -1143,14 +1200,9 @@ class Space:
                         f"Unrecognised transform with name {transform_name}"
                     )
 
-                bases = self.base_coordinates[ids]
-                shapes = self.cuboid_shapes[ids]
-                # Compute means for objects
-                object_means = (bases + (bases + shapes)) / 2
                 # Add to the total.
-                self.total += np.sum(object_means, axis=0).reshape((3, 1))
+                self.total += self._sum_object_means(ids)
 
-                self.mean = self.total / self.object_counter
             else:
                 raise ValueError("Unsupported operation")
 
@@ -1169,27 +1221,24 @@ class Space:
             )
 
         # First gather the IDs of primitive entries that match the coordinate.
-        matching_base_vectors = []
+        # This is done in a single pass over the live entries of the buffer,
+        # rather than comparing each entry one at a time.
+        base_coordinates = self.base_coordinates[: self.object_counter]
+        matches = np.all(base_coordinates == coordinate, axis=1)
+        matching_base_vectors = np.flatnonzero(matches).tolist()
         primitives_to_update, composites_to_update = [], []
 
-        for idx in range(self.object_counter):
-            base_coordinate = self.base_coordinates[idx]
-            if np.array_equal(base_coordinate, coordinate):
-                matching_base_vectors.append(idx)
-
-        primitive_id = next(self.cuboid_index.items(), None)
-        composite_id = next(self.composite_index.items(), None)
+        # Primitives and composites share the same IDs, so anything that is not
+        # a composite is a primitive. Objects are referenced in the index again
+        # whenever they are mutated or transformed, so only the distinct IDs
+        # are kept - this is computed once rather than per matching ID.
+        composite_ids = set(self.composite_index.items())
 
-        # For each index, check if it's a primitive or composite. If it is,
-        # add it to the relevant output buffer/increment the relevant iterator.
-        # If the relevant iterator is exhausted, use a default of None.
         for idx in matching_base_vectors:
-            if primitive_id is not None and primitive_id == idx:
-                primitives_to_update.append(primitive_id)
-                primitive_id = next(self.cuboid_index.items(), None)
-            if composite_id is not None and composite_id == idx:
-                composites_to_update.append(composite_id)
-                composite_id = next(self.composite_index.items(), None)
+            if idx in composite_ids:
+                composites_to_update.append(idx)
+            else:
+                primitives_to_update.append(idx)
 
         return primitives_to_update, composites_to_update
 
@@ -1229,6 +1278,20 @@ class Space:
 
         return primitive_ids, composite_ids
 
+    def _get_visual_properties(
+        self, object_id: int, keys: list[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Get the visual properties of the object with `object_id`.
+
+        # Args
+            object_id: The ID of the object (primitive or composite).
+            keys: An optional subset of the visual properties to fetch. By
+                default all visual properties are fetched.
+        """
+        keys = keys if keys is not None else self.cuboid_visual_metadata.keys()
+        return {k: self.cuboid_visual_metadata[k][object_id] for k in keys}
+
     def snapshot(self) -> None:
         """
         Store the current state of the space as a scene, used for rendering.
@@ -1273,42 +1336,36 @@ class Space:
             primitives = self.cuboid_index.get_items_by_timestep(timestep)
             composites = self.composite_index.get_items_by_timestep(timestep)
             if isinstance(operation, Addition):
-                for primitive in primitives:
-                    # Change of basis to WHD/XYZ format for the base point.
-                    base_coordinate = self.base_coordinates[primitive]
-                    shape = self.cuboid_shapes[primitive]
-                    visual_properties = {
-                        k: self.cuboid_visual_metadata[k][primitive]
-                        for k in self.cuboid_visual_metadata.keys()
-                    }
-                    self.visualisation_backend.populate_with_primitive(
-                        primitive, base_coordinate, shape, visual_properties
+                # All primitives added in this timestep are passed to the
+                # backend at once, so their vertices can be built together.
+                if primitives:
+                    self.visualisation_backend.populate_with_primitives(
+                        primitives,
+                        self.base_coordinates[primitives],
+                        self.cuboid_shapes[primitives],
+                        [self._get_visual_properties(p) for p in primitives],
                     )
                 for composite in composites:
                     base_coordinate = self.base_coordinates[composite]
                     shape = self.cuboid_shapes[composite].astype(np.int32)
-                    visual_properties = {
-                        k: self.cuboid_visual_metadata[k][composite]
-                        for k in self.cuboid_visual_metadata.keys()
-                    }
+                    visual_properties = self._get_visual_properties(composite)
                     self.visualisation_backend.populate_with_composite(
                         composite, base_coordinate, shape, visual_properties
                     )
             elif isinstance(operation, Mutation):
                 # Only need to fetch data for properties that were updated.
+                updated_keys = list(operation.subject.keys())
                 for primitive in primitives:
-                    metadata = {
-                        k: self.cuboid_visual_metadata[k][primitive]
-                        for k in operation.subject.keys()
-                    }
+                    metadata = self._get_visual_properties(
+                        primitive, updated_keys
+                    )
                     self.visualisation_backend.mutate_primitive(
                         primitive, metadata
                     )
                 for composite in composites:
-                    metadata = {
-                        k: self.cuboid_visual_metadata[k][composite]
-                        for k in operation.subject.keys()
-                    }
+                    metadata = self._get_visual_properties(
+                        composite, updated_keys
+                    )
                     self.visualisation_backend.mutate_composite(
                         composite, metadata
                     )
@@ -1343,9 +1400,15 @@ class Space:
         # everything and b) would mean the user cannot turn on the axes to debug
         # things as effectively. Potentially this could be explained in some
         # docs though.
-        base_max = np.max(self.base_coordinates)
-        shape_max = np.max((self.base_coordinates + self.cuboid_shapes))
-        max_val = max(base_max, shape_max)
+        # Only the live entries are considered - the buffers have spare
+        # capacity, and may contain stale data from objects that were undone.
+        bases = self.base_coordinates[: self.object_counter]
+        far_corners = bases + self.cuboid_shapes[: self.object_counter]
+        # The limits are symmetric, so they need to cover the largest magnitude
+        # in either direction.
+        max_val = np.maximum(np.abs(bases), np.abs(far_corners)).max(
+            initial=0.0
+        )
 
         fig, ax = self.visualisation_backend.fig, self.visualisation_backend.ax
 
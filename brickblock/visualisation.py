@@ -1,7 +1,5 @@
 from typing import Any
 
-import itertools
-import math
 import matplotlib.pyplot as plt
 
 # This import registers the 3D projection, but is otherwise unused.
@@ -10,17 +8,44 @@ from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import numpy as np
 
 
+# The points of a cuboid that make up each of its faces. Points are ordered as
+# in `materialise_vertices_for_primitive`.
+# Note: the ordering of points matters.
+_FACE_POINT_INDICES = np.array(
+    [
+        [0, 1, 2, 3],  # bottom
+        [0, 4, 7, 3],  # front face
+        [0, 1, 5, 4],  # left face
+        [3, 7, 6, 2],  # right face
+        [1, 5, 6, 2],  # back face
+        [4, 5, 6, 7],  # top
+    ]
+)
+
+
 def materialise_vertices_for_primitive(
     base: np.ndarray, shape: np.ndarray
 ) -> np.ndarray:
-    w = shape[0] * np.array([1, 0, 0])
-    h = shape[1] * np.array([0, 0, 1])
-    d = shape[2] * np.array([0, 1, 0])
+    # A single primitive always produces a 6x4x3 array, whether its base is
+    # given as a 3-vector or a 1x3 array.
+    return _materialise_vertices_for_primitives(
+        np.reshape(base, (1, 3)), np.reshape(shape, (1, 3))
+    ).reshape((6, 4, 3))
+
+
+def _materialise_vertices_for_primitives(
+    base: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    # Materialise the faces of K primitives at once, mapping Kx3 bases and
+    # shapes to a Kx6x4x3 output.
+    w = shape[:, 0:1] * np.array([1, 0, 0])
+    h = shape[:, 1:2] * np.array([0, 0, 1])
+    d = shape[:, 2:3] * np.array([0, 1, 0])
     # Shorthand convention is to have the 'bottom-left-front' point as
     # the base, with points defining width/height/depth of the cube
     # after (using the left-hand rule).
     # Note: the ordering of points matters.
-    points = np.array(
+    points = np.stack(
         [
             # bottom-left-front
             base,
@@ -38,19 +63,13 @@ def materialise_vertices_for_primitive(
             base + h + w + d,
             # top-right-front
             base + h + w,
-        ]
+        ],
+        axis=-2,
     )
 
-    return np.array(
-        [
-            (points[0], points[1], points[2], points[3]),  # bottom
-            (points[0], points[4], points[7], points[3]),  # front face
-            (points[0], points[1], points[5], points[4]),  # left face
-            (points[3], points[7], points[6], points[2]),  # right face
-            (points[1], points[5], points[6], points[2]),  # back face
-            (points[4], points[5], points[6], points[7]),  # top
-        ]
-    ).reshape((6, 4, 3))
+    # Gather the points for each face in one go, producing a 6x4x3 array per
+    # primitive.
+    return points[..., _FACE_POINT_INDICES, :]
 
 
 def materialise_vertices_for_composite(
@@ -87,35 +106,20 @@ def materialise_vertices_for_composite(
         ]
     )
 
-    composite_ranges = list(map(range, map(int, shape)))
-    all_cubes_all_points = np.array(
-        [
-            all_cube_points
-            + (w * width_basis_vector)
-            + (h * height_basis_vector)
-            + (d * depth_basis_vector)
-            for (w, h, d) in itertools.product(*composite_ranges)
-        ]
+    # The (w, h, d) position of each cube in the composite, in the same order
+    # as iterating over the width, then height, then depth.
+    composite_shape = tuple(int(dim) for dim in shape)
+    positions = np.indices(composite_shape).reshape((3, -1)).T
+    basis_vectors = np.array(
+        [width_basis_vector, height_basis_vector, depth_basis_vector]
     )
+    offsets = positions @ basis_vectors
 
-    num_cubes = int(math.prod(shape))
-    ps = all_cubes_all_points.reshape((num_cubes, 8, 3))
-
-    all_cube_faces = np.array(
-        [
-            [
-                (ps[i][0], ps[i][1], ps[i][2], ps[i][3]),  # bottom
-                (ps[i][0], ps[i][4], ps[i][7], ps[i][3]),  # front face
-                (ps[i][0], ps[i][1], ps[i][5], ps[i][4]),  # left face
-                (ps[i][3], ps[i][7], ps[i][6], ps[i][2]),  # right face
-                (ps[i][1], ps[i][5], ps[i][6], ps[i][2]),  # back face
-                (ps[i][4], ps[i][5], ps[i][6], ps[i][7]),  # top
-            ]
-            for i in range(num_cubes)
-        ]
-    )
+    # Broadcast to get an Nx8x3 array of points, then gather the faces for
+    # every cube at once.
+    ps = all_cube_points + offsets[:, np.newaxis, :]
 
-    return all_cube_faces.reshape((num_cubes, 6, 4, 3))
+    return ps[:, _FACE_POINT_INDICES]
 
 
 class VisualisationBackend:
@@ -125,7 +129,6 @@ class VisualisationBackend:
         # (assumed in XZY order).
         # TODO: Check this is the correct terminology.
         self.basis = space_transform
-        self._collections_per_object = []
 
     def _initialise_figure_and_ax(self) -> None:
         # Have a function for initialising the figure separately from __init__,
@@ -143,44 +146,48 @@ class VisualisationBackend:
     def _convert_basis(self, coordinate: np.ndarray) -> np.ndarray:
         return np.dot(coordinate, self.basis)
 
-    def populate_with_primitive(
+    def populate_with_primitives(
         self,
-        primitive_id: int,
-        base_coordinate: np.ndarray,
-        shape: np.ndarray,
-        visual_properties: dict[str, Any],
+        primitive_ids: list[int],
+        base_coordinates: np.ndarray,
+        shapes: np.ndarray,
+        visual_properties: list[dict[str, Any]],
     ) -> None:
         """
-        Add the primitive with `primitive_id` with `base_coordinate`, `shape`,
-        and `visual_properties` to the output of this backend.
+        Add the primitives with `primitive_ids` with `base_coordinates`,
+        `shapes`, and `visual_properties` to the output of this backend.
+
+        The vertices of all the primitives are materialised together in a
+        single array, and each primitive is added with a view into it.
 
         All input data is assumed to be in space-compatible format, and will be
         transformed to the native format of this backend (e.g. coordinates will
         be mapped to XZY - WHD order).
 
         # Args
-            primitive_id: The ID of the primitive to add.
-            base_coordinate: The base coordinate of the primitive.
-            shape: The shape to apply, in WHD order.
-            visual_properties: Object containing the properties to apply, and
-                their values.
+            primitive_ids: The IDs of the primitives to add, in order.
+            base_coordinates: The base coordinates of the primitives, as a Kx3
+                array.
+            shapes: The shapes to apply, in WHD order, as a Kx3 array.
+            visual_properties: Objects containing the properties to apply, and
+                their values, for each primitive.
         """
-        # Currently unused.
-        _ = primitive_id
-
         if self.figure_not_initialised:
             self._initialise_figure_and_ax()
 
-        materialised_vertices = materialise_vertices_for_primitive(
-            self._convert_basis(base_coordinate), shape
+        materialised_vertices = _materialise_vertices_for_primitives(
+            self._convert_basis(base_coordinates), shapes
         )
-        self._collections_per_object.append(1)
-        assert len(self._collections_per_object) == primitive_id + 1
 
-        matplotlib_like_cube = Poly3DCollection(
-            materialised_vertices, **visual_properties
-        )
-        self.ax.add_collection3d(matplotlib_like_cube)
+        for primitive_id, vertices, properties in zip(
+            primitive_ids, materialised_vertices, visual_properties
+        ):
+            # Each object is represented by exactly one collection, so the
+            # collections are indexed by object ID.
+            assert len(self.ax.collections) == primitive_id
+
+            matplotlib_like_cube = Poly3DCollection(vertices, **properties)
+            self.ax.add_collection3d(matplotlib_like_cube)
 
     def populate_with_composite(
         self,
@@ -197,10 +204,13 @@ class VisualisationBackend:
         transformed to the native format of this backend (e.g. coordinates will
         be mapped to XZY - WHD order).
 
+        All the faces of the composite are added as a single collection, since
+        every primitive in a composite shares the same visual properties.
+
         Currently the values of `visual_properties` must be scalars.
 
         # Args
-            composite_id: The IDs of all the primitives to add.
+            composite_id: The ID of the composite to add.
             base_coordinate: The base coordinate of the composite.
             shape: The shape to apply, in WHD order.
             visual_properties: Object containing the properties to apply, and
@@ -216,20 +226,13 @@ class VisualisationBackend:
         materialised_vertices = materialise_vertices_for_composite(
             self._convert_basis(base_coordinate), shape
         )
-        volume = math.prod(shape)
-        self._collections_per_object.append(volume)
-        assert len(self._collections_per_object) == composite_id + 1
-
-        primitive_visual_properties = {
-            k: visual_properties[k] for k in visual_properties.keys()
-        }
-
-        for primitive_id in range(volume):
-            matplotlib_like_cube = Poly3DCollection(
-                materialised_vertices[primitive_id],
-                **primitive_visual_properties,
-            )
-            self.ax.add_collection3d(matplotlib_like_cube)
+        assert len(self.ax.collections) == composite_id
+
+        # Flatten the faces of every primitive into one sequence of polygons.
+        matplotlib_like_composite = Poly3DCollection(
+            materialised_vertices.reshape((-1, 4, 3)), **visual_properties
+        )
+        self.ax.add_collection3d(matplotlib_like_composite)
 
     def mutate_primitive(
         self, primitive_id: int, visual_properties: dict[str, Any]
@@ -267,14 +270,7 @@ class VisualisationBackend:
         if self.figure_not_initialised:
             self._initialise_figure_and_ax()
 
-        primitive_visual_properties = {
-            k: visual_properties[k] for k in visual_properties.keys()
-        }
-
-        N = self._collections_per_object[composite_id]
-        for primitive_id in range(N):
-            offset = N + primitive_id
-            self.ax.collections[offset].set(**primitive_visual_properties)
+        self.ax.collections[composite_id].set(**visual_properties)
 
     def transform_primitive(
         self,
@@ -334,20 +330,15 @@ class VisualisationBackend:
 
         materialised_vertices = materialise_vertices_for_composite(
             self._convert_basis(base_coordinate), shape
-        )
+        ).reshape((-1, 4, 3))
 
-        N = self._collections_per_object[composite_id]
-        for primitive_id in range(N):
-            offset = N + primitive_id
-            if transform_name == "translation":
-                _ = shape
-                vertices = materialised_vertices[primitive_id]
-                self.ax.collections[offset].set_verts(vertices)
-            if transform_name == "reflection":
-                _ = shape
-                vertices = materialised_vertices[primitive_id]
-                self.ax.collections[offset].set_verts(vertices)
-            if transform_name == "scale":
-                raise ValueError(
-                    "Scaling for composites is not supported in this backend."
-                )
+        if transform_name == "translation":
+            _ = shape
+            self.ax.collections[composite_id].set_verts(materialised_vertices)
+        if transform_name == "reflection":
+            _ = shape
+            self.ax.collections[composite_id].set_verts(materialised_vertices)
+        if transform_name == "scale":
+            raise ValueError(
+                "Scaling for composites is not supported in this backend."
+            )
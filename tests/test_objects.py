@@ -1,19 +1,19 @@
 import pytest
 
-import matplotlib.pyplot as plt
-
-# This import registers the 3D projection, but is otherwise unused.
-from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 unused import
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import numpy as np
 
 import brickblock as bb
 
+# Shared by every test that only needs an object at the origin. Objects copy
+# their base vector, and making this read-only catches any test that doesn't.
+_ORIGIN = np.array([0, 0, 0])
+_ORIGIN.setflags(write=False)
+
 
 def test_cube_creation() -> None:
-    cube = bb.Cube(base_vector=np.array([0, 0, 0]))
+    cube = bb.Cube(base_vector=_ORIGIN)
 
-    assert np.array_equal(cube.base, np.array([0, 0, 0]))
+    assert np.array_equal(cube.base, _ORIGIN)
     assert cube.facecolor is None
     assert cube.linewidth == 0.1
     assert cube.edgecolor == "black"
@@ -34,16 +34,16 @@ def test_invalid_base_throws_exception_making_cube() -> None:
 def test_invalid_scale_throws_exception_making_cube() -> None:
     expected_err_msg = "Cube must have positively-sized dimensions."
     with pytest.raises(ValueError, match=expected_err_msg):
-        bb.Cube(base_vector=np.array([0, 0, 0]), scale=0.0)
+        bb.Cube(base_vector=_ORIGIN, scale=0.0)
     with pytest.raises(ValueError, match=expected_err_msg):
-        bb.Cube(base_vector=np.array([0, 0, 0]), scale=-1.0)
+        bb.Cube(base_vector=_ORIGIN, scale=-1.0)
 
 
 def test_composite_cube_creation() -> None:
     w, h, d = 4, 3, 3
-    composite = bb.CompositeCube(base_vector=np.array([0, 0, 0]), w=w, h=h, d=d)
+    composite = bb.CompositeCube(base_vector=_ORIGIN, w=w, h=h, d=d)
 
-    assert np.array_equal(composite.base, np.array([0, 0, 0]))
+    assert np.array_equal(composite.base, _ORIGIN)
     assert composite.w == w
     assert composite.h == h
     assert composite.d == d
@@ -61,13 +61,13 @@ def test_invalid_dims_throws_exception_making_composite_cube() -> None:
     expected_err_msg = "Composite object must have positively-sized dimensions."
 
     with pytest.raises(ValueError, match=expected_err_msg):
-        bb.CompositeCube(base_vector=np.array([0, 0, 0]), **invalid_dims)
+        bb.CompositeCube(base_vector=_ORIGIN, **invalid_dims)
 
 
 def test_cuboid_creation() -> None:
-    cuboid = bb.Cuboid(base_vector=np.array([0, 0, 0]), w=4.0, h=2.0, d=6.0)
+    cuboid = bb.Cuboid(base_vector=_ORIGIN, w=4.0, h=2.0, d=6.0)
 
-    assert np.array_equal(cuboid.base, np.array([0, 0, 0]))
+    assert np.array_equal(cuboid.base, _ORIGIN)
     assert cuboid.facecolor is None
     assert cuboid.linewidth == 0.1
     assert cuboid.edgecolor == "black"
@@ -81,12 +81,12 @@ def test_invalid_dims_throws_exception_making_cuboid() -> None:
     expected_err_msg = "Cuboid must have positively-sized dimensions."
 
     with pytest.raises(ValueError, match=expected_err_msg):
-        bb.Cuboid(base_vector=np.array([0, 0, 0]), **invalid_dims)
+        bb.Cuboid(base_vector=_ORIGIN, **invalid_dims)
 
 
 def test_objects_can_have_names() -> None:
     cuboid = bb.Cuboid(
-        base_vector=np.array([0, 0, 0]),
+        base_vector=_ORIGIN,
         w=4.0,
         h=2.0,
         d=6.0,
@@ -98,7 +98,7 @@ def test_objects_can_have_names() -> None:
 
 def test_composite_can_have_classic_style() -> None:
     composite = bb.CompositeCube(
-        base_vector=np.array([0, 0, 0]), w=4, h=2, d=6, style="classic"
+        base_vector=_ORIGIN, w=4, h=2, d=6, style="classic"
     )
 
     assert composite.style == "classic"
@@ -108,6 +108,4 @@ def test_composite_cannot_have_invalid_style() -> None:
     with pytest.raises(
         ValueError, match="Composite object was given an invalid style."
     ):
-        bb.CompositeCube(
-            base_vector=np.array([0, 0, 0]), w=4, h=2, d=6, style="some-style"
-        )
+        bb.CompositeCube(base_vector=_ORIGIN, w=4, h=2, d=6, style="some-style")
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import pytest
 
 import matplotlib.pyplot as plt
@@ -10,18 +12,61 @@ import brickblock as bb
 import brickblock.visualisation as bb_vis
 
 
+@pytest.fixture(autouse=True)
+def close_figures() -> Iterator[None]:
+    # Every space creates its own figure on render, and pyplot keeps a
+    # reference to each one. Close them after each test so figures don't pile
+    # up over the run.
+    yield
+    plt.close("all")
+
+
+def _live_visual_metadata(space: bb.Space) -> dict[str, list]:
+    # The visual metadata arrays have spare capacity, so only take the entries
+    # for objects currently in the space.
+    return {
+        k: list(v[: space.object_counter])
+        for k, v in space.cuboid_visual_metadata.items()
+    }
+
+
+def _augment_with_ones(faces: np.ndarray) -> np.ndarray:
+    # Add the implicit 4th dimension that matplotlib uses - all ones. Filling a
+    # preallocated array avoids the intermediate block of ones and the copy
+    # made by concatenating onto it.
+    augmented = np.empty(faces.shape[:-1] + (4,), dtype=faces.dtype)
+    augmented[..., :3] = faces
+    augmented[..., 3] = 1
+    return augmented
+
+
+def _collection_vertices(collection, shape: tuple[int, ...]) -> np.ndarray:
+    # matplotlib stores a collection's homogeneous vertices as a C-contiguous
+    # (4, N) array. Splitting N is free, and moving the coordinate axis last
+    # gives a view of shape `shape`, whereas `.T.reshape(shape)` copies.
+    vec = np.asarray(collection._vec)
+    return np.moveaxis(vec.reshape((vec.shape[0],) + shape[:-1]), 0, -1)
+
+
 def test_space_creation() -> None:
     space = bb.Space()
 
-    assert np.array_equal(space.mean, np.zeros((3, 1)))
-    assert np.array_equal(space.total, np.zeros((3, 1)))
+    assert space.mean.shape == (3, 1) and not space.mean.any()
+    assert space.total.shape == (3, 1) and not space.total.any()
     assert space.num_objs == 0
     assert space.object_counter == 0
     assert space.time_step == 0
     assert space.scene_counter == 0
-    assert np.array_equal(space.base_coordinates, np.zeros((10, 3)))
-    assert np.array_equal(space.cuboid_shapes, np.zeros((10, 3)))
-    assert space.cuboid_visual_metadata == {}
+    assert space.base_coordinates.shape == (10, 3)
+    assert not space.base_coordinates.any()
+    assert space.cuboid_shapes.shape == (10, 3)
+    assert not space.cuboid_shapes.any()
+    assert _live_visual_metadata(space) == {
+        "facecolor": [],
+        "linewidth": [],
+        "edgecolor": [],
+        "alpha": [],
+    }
     assert space.cuboid_index == bb.TemporalIndex()
     assert space.composite_index == bb.TemporalIndex()
     assert space.changelog == bb.TemporalIndex()
@@ -30,7 +75,7 @@ def test_space_creation() -> None:
 def test_space_snapshot_creates_a_scene() -> None:
     space = bb.Space()
 
-    point = np.array([0, 0, 0]).reshape((1, 3))
+    point = np.array([[0, 0, 0]])
     cube = bb.Cube(base_vector=point, scale=1.0)
     space.add_cube(cube)
     space.snapshot()
@@ -50,7 +95,7 @@ def test_space_snapshot_creates_a_scene() -> None:
         space.cuboid_shapes,
         np.concatenate((np.ones((1, 3)), np.zeros((empty_entries, 3))), axis=0),
     )
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None],
         "linewidth": [0.1],
         "edgecolor": ["black"],
@@ -70,7 +115,7 @@ def test_space_snapshot_creates_a_scene() -> None:
 def test_space_multiple_snapshots_create_multiple_scenes() -> None:
     space = bb.Space()
 
-    point = np.array([0, 0, 0]).reshape((1, 3))
+    point = np.array([[0, 0, 0]])
     cube = bb.Cube(base_vector=point, scale=1.0)
     space.add_cube(cube)
     space.snapshot()
@@ -96,7 +141,7 @@ def test_space_multiple_snapshots_create_multiple_scenes() -> None:
         space.cuboid_shapes,
         np.concatenate((np.ones((2, 3)), np.zeros((empty_entries, 3))), axis=0),
     )
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None, None],
         "linewidth": [0.1, 0.1],
         "edgecolor": ["black", "black"],
@@ -137,6 +182,19 @@ def test_space_creates_distinct_scenes_only() -> None:
         space.snapshot()
 
 
+def test_materialised_primitive_vertices_have_one_primitive_shape() -> None:
+    shape = np.array([1.0, 2.0, 3.0])
+    vertices = bb_vis.materialise_vertices_for_primitive(
+        np.array([1, 2, 3]), shape
+    )
+    row_vertices = bb_vis.materialise_vertices_for_primitive(
+        np.array([[1, 2, 3]]), shape
+    )
+
+    assert vertices.shape == (6, 4, 3)
+    assert np.array_equal(vertices, row_vertices)
+
+
 def test_space_creates_valid_axes_on_render() -> None:
     space = bb.Space()
 
@@ -151,19 +209,44 @@ def test_space_creates_valid_axes_on_render() -> None:
     assert (ax.axes.xy_viewLim.y0, ax.axes.xy_viewLim.y1) == (-1, 1)
     assert (ax.axes.zz_viewLim.x0, ax.axes.zz_viewLim.x1) == (-1, 1)
 
-    plt_internal_data = ax.collections[0]._vec
-    plt_internal_reshaped_data = plt_internal_data.T.reshape((6, 4, 4))
+    plt_internal_reshaped_data = _collection_vertices(
+        ax.collections[0], (6, 4, 4)
+    )
 
     cube_shape = np.array(cube.shape())
     cube_faces = bb_vis.materialise_vertices_for_primitive(point, cube_shape)
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    original_augmented_data = np.concatenate([cube_faces, ones], -1)
+    original_augmented_data = _augment_with_ones(cube_faces)
 
     assert np.array_equal(original_augmented_data, plt_internal_reshaped_data)
 
 
+def test_space_view_limits_ignore_undone_objects_on_render() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0]), scale=1.0))
+    space.add_cube(bb.Cube(base_vector=np.array([10, 10, 10]), scale=1.0))
+    space.undo_last_timestep()
+    space.snapshot()
+    _, ax = space.render()
+
+    assert (ax.axes.xy_viewLim.x0, ax.axes.xy_viewLim.x1) == (-1, 1)
+    assert (ax.axes.xy_viewLim.y0, ax.axes.xy_viewLim.y1) == (-1, 1)
+    assert (ax.axes.zz_viewLim.x0, ax.axes.zz_viewLim.x1) == (-1, 1)
+
+
+def test_space_view_limits_include_negative_coordinates_on_render() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([-5, -5, -5]), scale=1.0))
+    space.snapshot()
+    _, ax = space.render()
+
+    assert (ax.axes.xy_viewLim.x0, ax.axes.xy_viewLim.x1) == (-5, 5)
+    assert (ax.axes.xy_viewLim.y0, ax.axes.xy_viewLim.y1) == (-5, 5)
+    assert (ax.axes.zz_viewLim.x0, ax.axes.zz_viewLim.x1) == (-5, 5)
+
+
 def test_space_does_nothing_on_render_when_empty() -> None:
     ...
 
@@ -188,12 +271,9 @@ def test_space_creates_valid_axes_on_render_multiple_scenes() -> None:
     assert (ax2.axes.xy_viewLim.y0, ax2.axes.xy_viewLim.y1) == (-4, 4)
     assert (ax2.axes.zz_viewLim.x0, ax2.axes.zz_viewLim.x1) == (-4, 4)
 
-    plt_internal_data_for_first_cube = ax2.collections[0]._vec.T
-    plt_internal_data_for_second_cube = ax2.collections[1]._vec.T
-    plt_internal_reshaped_data = np.concatenate(
-        [plt_internal_data_for_first_cube, plt_internal_data_for_second_cube],
-        axis=0,
-    ).reshape((2, 6, 4, 4))
+    plt_internal_reshaped_data = np.stack(
+        [_collection_vertices(c, (6, 4, 4)) for c in ax2.collections[:2]]
+    )
 
     cube_shape = np.array(cube.shape())
     cube_faces = bb_vis.materialise_vertices_for_primitive(point, cube_shape)
@@ -201,12 +281,8 @@ def test_space_creates_valid_axes_on_render_multiple_scenes() -> None:
         point + 3, cube_shape
     )
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    original_augmented_first_cube = np.concatenate([cube_faces, ones], -1)
-    original_augmented_second_cube = np.concatenate(
-        [second_cube_faces, ones], -1
-    )
+    original_augmented_first_cube = _augment_with_ones(cube_faces)
+    original_augmented_second_cube = _augment_with_ones(second_cube_faces)
 
     expected_data = np.stack(
         [original_augmented_first_cube, original_augmented_second_cube], axis=0
@@ -218,7 +294,7 @@ def test_space_creates_valid_axes_on_render_multiple_scenes() -> None:
 def test_space_add_multiple_cubes_in_single_scene() -> None:
     space = bb.Space()
 
-    point = np.array([0, 0, 0]).reshape((1, 3))
+    point = np.array([[0, 0, 0]])
     cube = bb.Cube(base_vector=point, scale=1.0)
     second_cube = bb.Cube(base_vector=point + 3, scale=1.0)
 
@@ -242,7 +318,7 @@ def test_space_add_multiple_cubes_in_single_scene() -> None:
         space.cuboid_shapes,
         np.concatenate((np.ones((2, 3)), empty_entries_arr), axis=0),
     )
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None, None],
         "linewidth": [0.1, 0.1],
         "edgecolor": ["black", "black"],
@@ -282,12 +358,9 @@ def test_space_creates_valid_axes_on_render_multiple_cubes_single_scene() -> (
     space.snapshot()
     _, ax = space.render()
 
-    plt_internal_data_for_first_cube = ax.collections[0]._vec.T
-    plt_internal_data_for_second_cube = ax.collections[1]._vec.T
-    plt_internal_reshaped_data = np.concatenate(
-        [plt_internal_data_for_first_cube, plt_internal_data_for_second_cube],
-        axis=0,
-    ).reshape((2, 6, 4, 4))
+    plt_internal_reshaped_data = np.stack(
+        [_collection_vertices(c, (6, 4, 4)) for c in ax.collections[:2]]
+    )
 
     cube_shape = np.array(cube.shape())
     cube_faces = bb_vis.materialise_vertices_for_primitive(
@@ -299,12 +372,8 @@ def test_space_creates_valid_axes_on_render_multiple_cubes_single_scene() -> (
         second_point_swapped, cube_shape
     )
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    original_augmented_first_cube = np.concatenate([cube_faces, ones], -1)
-    original_augmented_second_cube = np.concatenate(
-        [second_cube_faces, ones], -1
-    )
+    original_augmented_first_cube = _augment_with_ones(cube_faces)
+    original_augmented_second_cube = _augment_with_ones(second_cube_faces)
 
     expected_data = np.stack(
         [original_augmented_first_cube, original_augmented_second_cube], axis=0
@@ -332,29 +401,21 @@ def test_space_creates_valid_axes_on_render_multiple_cubes_scenes() -> None:
     space.snapshot()
     _, ax = space.render()
 
-    plt_internal_data_for_cubes = [ax.collections[i]._vec.T for i in range(4)]
-    plt_internal_reshaped_data = np.concatenate(
-        plt_internal_data_for_cubes, axis=0
-    ).reshape((4, 6, 4, 4))
+    plt_internal_reshaped_data = np.stack(
+        [_collection_vertices(c, (6, 4, 4)) for c in ax.collections[:4]]
+    )
 
     cube_shape = np.array(cube.shape())
     # Swap the ys and zs for matplotlib compatibility.
-    cube_points = list(
-        map(
-            lambda arr: np.array([arr[0], arr[2], arr[1]]),
-            [cube.base, second_cube.base, third_cube.base, fourth_cube.base],
-        )
-    )
+    cube_points = [
+        c.base[[0, 2, 1]] for c in [cube, second_cube, third_cube, fourth_cube]
+    ]
     all_cube_faces = [
         bb_vis.materialise_vertices_for_primitive(cube_points[i], cube_shape)
         for i in range(4)
     ]
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    original_augmented_cubes = [
-        np.concatenate([c, ones], -1) for c in all_cube_faces
-    ]
+    original_augmented_cubes = [_augment_with_ones(c) for c in all_cube_faces]
 
     expected_data = np.stack(original_augmented_cubes, axis=0)
 
@@ -375,7 +436,7 @@ def test_space_can_customise_cube_visual_properties() -> None:
         alpha=alpha,
     )
     space.add_cube(cube)
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [(red, green, blue)],
         "linewidth": [linewidth],
         "edgecolor": ["black"],
@@ -387,7 +448,7 @@ def test_space_can_customise_cube_visual_properties() -> None:
     plt_collection = ax.axes.collections[0]
 
     # Check colours
-    expected_rgba = np.array([red, green, blue, alpha]).reshape((1, 4))
+    expected_rgba = np.array([[red, green, blue, alpha]])
     actual_rgba = plt_collection._facecolor3d
     assert np.array_equal(expected_rgba, actual_rgba)
 
@@ -395,7 +456,7 @@ def test_space_can_customise_cube_visual_properties() -> None:
     expected_linewidths = np.array([linewidth])
     actual_linewidths = plt_collection._linewidths
     assert np.array_equal(expected_linewidths, actual_linewidths)
-    expected_edgecolors = np.array([0.0, 0.0, 0.0, alpha]).reshape((1, 4))
+    expected_edgecolors = np.array([[0.0, 0.0, 0.0, alpha]])
     actual_edgecolors = plt_collection._edgecolors
     assert np.array_equal(expected_edgecolors, actual_edgecolors)
 
@@ -403,7 +464,7 @@ def test_space_can_customise_cube_visual_properties() -> None:
 def test_space_can_add_composite_cube() -> None:
     space = bb.Space()
 
-    point = np.array([0, 0, 0]).reshape((1, 3))
+    point = np.array([[0, 0, 0]])
     w, h, d = 4, 3, 2
     composite = bb.CompositeCube(base_vector=point, w=w, h=h, d=d)
 
@@ -420,7 +481,7 @@ def test_space_can_add_composite_cube() -> None:
     empty_entries = 9
     empty_entries_arr = np.zeros((empty_entries, 3))
 
-    expected_shape = np.array([w, h, d]).reshape((1, 3))
+    expected_shape = np.array([[w, h, d]])
 
     assert np.array_equal(
         space.base_coordinates,
@@ -430,7 +491,7 @@ def test_space_can_add_composite_cube() -> None:
         space.cuboid_shapes,
         np.concatenate((expected_shape, empty_entries_arr), axis=0),
     )
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None],
         "linewidth": [0.1],
         "edgecolor": ["black"],
@@ -484,26 +545,71 @@ def test_space_creates_valid_axes_on_render_for_composite() -> None:
         second_point_swapped, composite_shape
     )
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    for i in range(num_cubes):
-        plt_internal_data = ax.collections[i]._vec
-        plt_internal_reshaped_data = plt_internal_data.T.reshape((6, 4, 4))
+    # Each composite is rendered as a single collection.
+    assert len(ax.collections) == 2
+
+    for i, faces in enumerate([composite_faces, second_composite_faces]):
+        plt_internal_reshaped_data = _collection_vertices(
+            ax.collections[i], (num_cubes, 6, 4, 4)
+        )
 
-        original_augmented_data = np.concatenate([composite_faces[i], ones], -1)
+        original_augmented_data = _augment_with_ones(faces)
 
         assert np.array_equal(
             original_augmented_data, plt_internal_reshaped_data
         )
 
-    for i in range(num_cubes, 2 * num_cubes):
-        plt_internal_data = ax.collections[i]._vec
-        plt_internal_reshaped_data = plt_internal_data.T.reshape((6, 4, 4))
 
-        offset = i - num_cubes
-        original_augmented_data = np.concatenate(
-            [second_composite_faces[offset], ones], -1
+def test_space_mutates_collections_by_object_id_on_render() -> None:
+    space = bb.Space()
+
+    space.add_composite(
+        bb.CompositeCube(
+            base_vector=np.array([0, 0, 0]), w=2, h=2, d=2, facecolor="yellow"
+        )
+    )
+    space.add_cube(bb.Cube(base_vector=np.array([3, 3, 3]), name="my-cube"))
+    space.render()
+
+    space.mutate_by_name(name="my-cube", facecolor="red", alpha=1.0)
+    _, ax = space.render()
+
+    assert len(ax.collections) == 2
+    composite_rgba = np.array([[1.0, 1.0, 0.0, 1.0]])
+    cube_rgba = np.array([[1.0, 0.0, 0.0, 1.0]])
+    assert np.array_equal(ax.collections[0]._facecolor3d, composite_rgba)
+    assert np.array_equal(ax.collections[1]._facecolor3d, cube_rgba)
+
+
+def test_space_creates_valid_axes_on_render_for_cloned_primitives() -> None:
+    space = bb.Space()
+
+    first_point = np.array([0, 0, 0])
+    second_point = np.array([2, 0, 1])
+    offset = np.array([0, 5, 0])
+    space.add_cube(bb.Cube(base_vector=first_point))
+    space.add_cuboid(bb.Cuboid(base_vector=second_point, w=1.0, h=2.0, d=3.0))
+    space.clone_by_offset(offset, scene=0)
+    _, ax = space.render()
+
+    assert len(ax.collections) == 4
+
+    # The clones are added in the same timestep, and rendered together.
+    cube_shape = np.array([1.0, 1.0, 1.0])
+    cuboid_shape = np.array([1.0, 2.0, 3.0])
+    # Swap the ys and zs of the bases for matplotlib compatibility.
+    cloned_cube_faces = bb_vis.materialise_vertices_for_primitive(
+        np.array([0, 0, 5]), cube_shape
+    )
+    cloned_cuboid_faces = bb_vis.materialise_vertices_for_primitive(
+        np.array([2, 1, 5]), cuboid_shape
+    )
+
+    for i, faces in [(2, cloned_cube_faces), (3, cloned_cuboid_faces)]:
+        plt_internal_reshaped_data = _collection_vertices(
+            ax.collections[i], (6, 4, 4)
         )
+        original_augmented_data = _augment_with_ones(faces)
 
         assert np.array_equal(
             original_augmented_data, plt_internal_reshaped_data
@@ -513,7 +619,7 @@ def test_space_creates_valid_axes_on_render_for_composite() -> None:
 def test_space_can_add_cuboid() -> None:
     space = bb.Space()
 
-    point = np.array([0, 0, 0]).reshape((1, 3))
+    point = np.array([[0, 0, 0]])
     w, h, d = 4, 2, 6
     cuboid = bb.Cuboid(base_vector=point, w=w, h=h, d=d)
 
@@ -528,7 +634,7 @@ def test_space_can_add_cuboid() -> None:
     assert space.scene_counter == 1
 
     empty_entries = 9
-    expected_shape = np.array([[4, 2, 6]]).reshape((1, 3))
+    expected_shape = np.array([[4, 2, 6]])
 
     assert np.array_equal(
         space.base_coordinates,
@@ -538,7 +644,7 @@ def test_space_can_add_cuboid() -> None:
         space.cuboid_shapes,
         np.concatenate((expected_shape, np.zeros((empty_entries, 3))), axis=0),
     )
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None],
         "linewidth": [0.1],
         "edgecolor": ["black"],
@@ -566,17 +672,16 @@ def test_space_creates_valid_axes_on_render_for_cuboid() -> None:
     space.snapshot()
     _, ax = space.render()
 
-    plt_internal_data = ax.collections[0]._vec
-    plt_internal_reshaped_data = plt_internal_data.T.reshape((6, 4, 4))
+    plt_internal_reshaped_data = _collection_vertices(
+        ax.collections[0], (6, 4, 4)
+    )
 
     cuboid_shape = np.array(cuboid.shape())
     cuboid_faces = bb_vis.materialise_vertices_for_primitive(
         point, cuboid_shape
     )
 
-    # Add the implicit 4th dimension to the original data - all ones.
-    ones = np.ones((6, 4, 1))
-    original_augmented_data = np.concatenate([cuboid_faces, ones], -1)
+    original_augmented_data = _augment_with_ones(cuboid_faces)
 
     assert np.array_equal(original_augmented_data, plt_internal_reshaped_data)
 
@@ -762,6 +867,87 @@ def test_space_mutates_multiple_objects_by_coordinate() -> None:
     assert space.composite_index.get_items_by_timestep(2) == [0]
 
 
+def test_space_mutates_interleaved_objects_by_coordinate() -> None:
+    space = bb.Space()
+
+    point = np.array([1, 2, 3])
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0])))
+    space.add_cube(bb.Cube(base_vector=point))
+    space.add_composite(bb.CompositeCube(base_vector=point, w=2, h=2, d=2))
+    space.add_cube(bb.Cube(base_vector=point))
+
+    space.mutate_by_coordinate(coordinate=point, facecolor="red")
+
+    assert space.changelog[-1] == bb.Mutation(
+        mutated_count=3,
+        subject={"facecolor": [None, None, None]},
+        coordinate=point,
+    )
+    assert _live_visual_metadata(space)["facecolor"] == [
+        None,
+        "red",
+        "red",
+        "red",
+    ]
+    assert space.cuboid_index.get_items_by_timestep(4) == [1, 3]
+    assert space.composite_index.get_items_by_timestep(4) == [2]
+
+
+def test_space_mutates_multiple_objects_with_rgb_colour() -> None:
+    space = bb.Space()
+
+    point = np.array([1, 2, 3])
+    space.add_cube(bb.Cube(base_vector=point))
+    space.add_composite(bb.CompositeCube(base_vector=point, w=2, h=2, d=2))
+    space.add_cube(bb.Cube(base_vector=point))
+
+    rgb = (1.0, 0.5, 0.0)
+    space.mutate_by_coordinate(coordinate=point, facecolor=rgb, alpha=0.5)
+
+    assert _live_visual_metadata(space)["facecolor"] == [rgb, rgb, rgb]
+    assert _live_visual_metadata(space)["alpha"] == [0.5, 0.5, 0.5]
+
+
+def test_space_rejects_non_numeric_visual_properties() -> None:
+    space = bb.Space()
+
+    point = np.array([1, 2, 3])
+    expected_err_msg = "The visual property linewidth must be a real number."
+    with pytest.raises(ValueError, match=expected_err_msg):
+        space.add_cube(bb.Cube(base_vector=point, linewidth=None))
+
+    # Nothing is added by the failed insert.
+    assert space.object_counter == 0
+    assert not space.total.any()
+
+    space.add_cube(bb.Cube(base_vector=point))
+
+    expected_err_msg = "The visual property alpha must be a real number."
+    with pytest.raises(ValueError, match=expected_err_msg):
+        space.mutate_by_coordinate(coordinate=point, alpha=None)
+
+    assert _live_visual_metadata(space)["alpha"] == [0.0]
+
+
+def test_space_leaves_metadata_unchanged_on_failed_mutation() -> None:
+    space = bb.Space()
+
+    point = np.array([1, 2, 3])
+    space.add_cube(bb.Cube(base_vector=point))
+    space.add_composite(bb.CompositeCube(base_vector=point, w=2, h=2, d=2))
+    metadata_before = _live_visual_metadata(space)
+
+    expected_err_msg = "The visual property alpha must be a real number."
+    with pytest.raises(ValueError, match=expected_err_msg):
+        space.mutate_by_coordinate(
+            coordinate=point, facecolor="red", alpha="opaque"
+        )
+
+    assert _live_visual_metadata(space) == metadata_before
+    assert space.changelog.get_items_by_timestep(2) == []
+    assert space.time_step == 2
+
+
 def test_space_mutates_primitive_by_name() -> None:
     space = bb.Space()
 
@@ -1195,13 +1381,13 @@ def test_space_mutates_nothing_on_empty_selection() -> None:
 def test_space_clones_cuboid_from_offset_with_selections() -> None:
     space = bb.Space()
 
-    base_point = np.array([0, 0, 0]).reshape((1, 3))
+    base_point = np.array([[0, 0, 0]])
     space.add_cube(bb.Cube(base_vector=base_point, scale=2.0, name="my-cube"))
 
-    first_offset = np.array([12, 0, 0]).reshape((1, 3))
-    second_offset = np.array([0, 12, 0]).reshape((1, 3))
-    third_offset = np.array([0, 0, 12]).reshape((1, 3))
-    fourth_offset = np.array([32, 0, 0]).reshape((1, 3))
+    first_offset = np.array([[12, 0, 0]])
+    second_offset = np.array([[0, 12, 0]])
+    third_offset = np.array([[0, 0, 12]])
+    fourth_offset = np.array([[32, 0, 0]])
 
     space.clone_by_offset(first_offset, coordinate=base_point)
     space.clone_by_offset(second_offset, name="my-cube")
@@ -1222,7 +1408,7 @@ def test_space_clones_cuboid_from_offset_with_selections() -> None:
     empty_entries = 2
     expected_point = base_point
 
-    expected_shape = np.array([2, 2, 2]).reshape((1, 3))
+    expected_shape = np.array([[2, 2, 2]])
 
     assert np.array_equal(
         space.base_coordinates,
@@ -1252,7 +1438,7 @@ def test_space_clones_cuboid_from_offset_with_selections() -> None:
     )
 
     N = space.object_counter
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None] * N,
         "linewidth": [0.1] * N,
         "edgecolor": ["black"] * N,
@@ -1281,7 +1467,7 @@ def test_space_clones_cuboid_from_offset_with_selections() -> None:
 def test_space_clones_composites_from_offset_with_selections() -> None:
     space = bb.Space()
 
-    base_point = np.array([0, 0, 0]).reshape((1, 3))
+    base_point = np.array([[0, 0, 0]])
     w, h, d = 3, 4, 2
     space.add_composite(
         bb.CompositeCube(
@@ -1289,10 +1475,10 @@ def test_space_clones_composites_from_offset_with_selections() -> None:
         )
     )
 
-    first_offset = np.array([12, 0, 0]).reshape((1, 3))
-    second_offset = np.array([0, 12, 0]).reshape((1, 3))
-    third_offset = np.array([0, 0, 12]).reshape((1, 3))
-    fourth_offset = np.array([32, 0, 0]).reshape((1, 3))
+    first_offset = np.array([[12, 0, 0]])
+    second_offset = np.array([[0, 12, 0]])
+    third_offset = np.array([[0, 0, 12]])
+    fourth_offset = np.array([[32, 0, 0]])
 
     space.clone_by_offset(first_offset, coordinate=base_point)
     # This should be treated as a no-op.
@@ -1314,7 +1500,7 @@ def test_space_clones_composites_from_offset_with_selections() -> None:
 
     empty_entries = 2
     expected_point = base_point
-    expected_shape = np.array([3, 4, 2]).reshape((1, 3))
+    expected_shape = np.array([[3, 4, 2]])
 
     assert np.array_equal(
         space.base_coordinates,
@@ -1343,7 +1529,7 @@ def test_space_clones_composites_from_offset_with_selections() -> None:
         ),
     )
     N = space.object_counter
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": [None] * N,
         "linewidth": [0.1] * N,
         "edgecolor": ["black"] * N,
@@ -1443,7 +1629,7 @@ def test_space_clones_composites_from_offset_with_updated_visuals() -> None:
         alpha=[1.0] * 4,
     )
 
-    assert space.cuboid_visual_metadata == {
+    assert _live_visual_metadata(space) == {
         "facecolor": all_face_colors,
         "linewidth": [0.1] * 8,
         "edgecolor": all_edge_colors,
@@ -1451,6 +1637,44 @@ def test_space_clones_composites_from_offset_with_updated_visuals() -> None:
     }
 
 
+def test_space_clones_nothing_on_invalid_visuals() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0])))
+    space.add_cube(bb.Cube(base_vector=np.array([2, 2, 2])))
+    total_before = np.copy(space.total)
+
+    expected_err_msg = "The visual property linewidth must be a real number."
+    with pytest.raises(ValueError, match=expected_err_msg):
+        space.clone_by_offset(
+            np.array([5, 0, 0]), scene=0, linewidth=[0.5, "thick"]
+        )
+
+    assert space.object_counter == 2
+    assert np.array_equal(space.total, total_before)
+    assert space.cuboid_index.get_items_by_timestep(2) == []
+
+    # The space is still consistent, so undoing works as normal.
+    space.undo_last_timestep()
+    assert space.object_counter == 1
+
+
+def test_space_mean_reflects_transforms() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0])))
+    space.add_cube(bb.Cube(base_vector=np.array([2, 2, 2])))
+    assert np.array_equal(space.mean, np.array([[1.5], [1.5], [1.5]]))
+
+    space.transform_by_timestep(timestep=1, translate=np.array([4, 0, 0]))
+    assert np.array_equal(space.mean, np.array([[3.5], [1.5], [1.5]]))
+
+    space.undo_last_timestep()
+    space.undo_last_timestep()
+    space.undo_last_timestep()
+    assert np.array_equal(space.mean, np.zeros((3, 1)))
+
+
 def test_space_transforms_primitive_by_coordinate() -> None:
     space = bb.Space()
 
@@ -2147,7 +2371,7 @@ def test_space_transforms_nothing_on_empty_selection() -> None:
 def test_space_transforms_nothing_with_trivial_transform() -> None:
     space = bb.Space()
 
-    point = np.array([1, 2, 3]).reshape((1, 3))
+    point = np.array([[1, 2, 3]])
     space.add_cube(bb.Cube(base_vector=point))
 
     translate = np.array([0, 0, 0])
@@ -2167,7 +2391,7 @@ def test_space_transforms_nothing_with_trivial_transform() -> None:
     ]
 
     expected_point = point
-    expected_shape = np.array([1, 1, 1]).reshape((1, 3))
+    expected_shape = np.array([[1, 1, 1]])
 
     empty_entries = 9
     assert np.array_equal(
@@ -2296,7 +2520,7 @@ def test_space_supports_undo_by_last_timestep() -> None:
     coordinates_before = np.copy(space.base_coordinates[:num_objs_before])
     shapes_before = np.copy(space.cuboid_shapes[:num_objs_before])
     vis_metadata_before = {
-        k: v[:num_objs_before]
+        k: list(v[:num_objs_before])
         for (k, v) in space.cuboid_visual_metadata.items()
     }
 
@@ -2335,7 +2559,7 @@ def test_space_supports_undo_by_last_timestep() -> None:
     assert np.array_equal(coordinates_before, coordinates_now)
     assert np.array_equal(shapes_before, shapes_now)
     vis_metadata_after_undone_adds = {
-        k: v[:num_objs_after_adds]
+        k: list(v[:num_objs_after_adds])
         for (k, v) in space.cuboid_visual_metadata.items()
     }
     assert vis_metadata_before == vis_metadata_after_undone_adds
@@ -2349,12 +2573,67 @@ def test_space_supports_undo_by_last_timestep() -> None:
     num_objs_after_mutation = space.object_counter
     assert num_objs_after_mutation == num_objs_after_adds
     vis_metadata_after_undone_mutation = {
-        k: v[:num_objs_after_mutation]
+        k: list(v[:num_objs_after_mutation])
         for (k, v) in space.cuboid_visual_metadata.items()
     }
     assert vis_metadata_before == vis_metadata_after_undone_mutation
 
 
+def test_space_overwrites_visual_metadata_of_undone_additions() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0]), facecolor="red"))
+    space.add_cube(bb.Cube(base_vector=np.array([1, 1, 1]), facecolor="green"))
+    space.undo_last_timestep()
+    space.add_cube(
+        bb.Cube(base_vector=np.array([2, 2, 2]), facecolor="blue", alpha=0.5)
+    )
+
+    assert _live_visual_metadata(space) == {
+        "facecolor": ["red", "blue"],
+        "linewidth": [0.1, 0.1],
+        "edgecolor": ["black", "black"],
+        "alpha": [1.0, 0.5],
+    }
+
+
+def test_space_keeps_visual_metadata_views_valid_when_growing() -> None:
+    space = bb.Space()
+
+    space.add_cube(bb.Cube(base_vector=np.array([0, 0, 0]), facecolor="red"))
+    facecolors = space.cuboid_visual_metadata["facecolor"][:1]
+
+    # Grow well past the initial capacity.
+    for i in range(1, 2000):
+        space.add_cube(bb.Cube(base_vector=np.array([i, 0, 0])))
+
+    assert facecolors[0] == "red"
+    assert space.cuboid_visual_metadata["facecolor"][0] == "red"
+    assert space.cuboid_visual_metadata["facecolor"].shape[0] >= 2000
+
+
+def test_space_supports_undo_of_mutation_by_last_timestep() -> None:
+    space = bb.Space()
+
+    for i in range(4):
+        space.add_cube(bb.Cube(base_vector=np.array([i, 0, 0])))
+    space.add_cube(
+        bb.Cube(base_vector=np.array([5, 0, 0]), facecolor=(0.0, 1.0, 0.0))
+    )
+
+    space.mutate_by_timestep(timestep=2, facecolor="red", alpha=0.5)
+    space.mutate_by_timestep(timestep=4, facecolor="red", alpha=0.5)
+    space.undo_last_timestep()
+    space.undo_last_timestep()
+
+    assert _live_visual_metadata(space) == {
+        "facecolor": [None, None, None, None, (0.0, 1.0, 0.0)],
+        "linewidth": [0.1] * 5,
+        "edgecolor": ["black"] * 5,
+        "alpha": [0.0, 0.0, 0.0, 0.0, 1.0],
+    }
+
+
 def test_space_supports_undo_by_last_timestep_when_space_is_empty() -> None:
     space = bb.Space()
     # This should be valid and do nothing - no exceptions/errors.